@@ -75,8 +75,110 @@
 
 import tkinter as tk
 from tkinter import ttk, simpledialog, messagebox, filedialog
+import bisect
 import csv
+import itertools
 import os
+import re
+from functools import lru_cache
+
+# Canvas grid geometry (pixels)
+CELL_W, CELL_H = 64, 26
+HEADER_W, HEADER_H = 80, 36
+CELL_TEXT_LEN = 10      # chars shown in a cell before truncating
+
+CSV_FIELDS = ("Desc.", "Sub-layer name", "Freq.", "Max power", "Q-pulse", "LI")
+
+# CSV metadata block (ends with the blank separator line); filled from _snapshot_vars()
+_META_TPL = (
+    "# Title: {title}\n"
+    "# Freq Start: {freq_start}\n"
+    "# Freq End: {freq_end}\n"
+    "# Q1 Start: {q1_start}\n"
+    "# Q1 End: {q1_end}\n"
+    "# Q2 Start: {q2_start}\n"
+    "# Q2 End: {q2_end}\n"
+    "# Mode: {mode}\n"
+    "# Angle Increment: {angle_inc}\n"
+    "# Auto Rotate: {auto_rotate}\n"
+    "# Bi-directional: {bi_dir}\n"
+    "# Cross-hatch: {cross_hatch}\n"
+    "\n"
+)
+
+# Summary popup body; filled from get_params_dict() and _snapshot_vars()
+_SUMMARY_TPL = (
+    "Title: {title}\n"
+    "Parameters:\n"
+    "  speed: {speed}\n"
+    "  power: {power}\n"
+    "  li: {li}\n"
+    "  passes: {passes}\n"
+    "\n"
+    "Scan Settings:\n"
+    "  Mode: {mode}\n"
+    "  Angle increment: {angle_inc}°\n"
+    "  Auto-rotate: {auto_rotate}°\n"
+    "  Bi-directional: {bi_dir}\n"
+    "  Cross-hatch: {cross_hatch}\n"
+    "\n"
+    "Ranges:\n"
+    "  Freq: {freq_start} → {freq_end}\n"
+    "  Q1: {q1_start} → {q1_end}\n"
+    "  Q2: {q2_start} → {q2_end}"
+)
+
+# "# Key: value" metadata line, with key and value already stripped
+_META_RE = re.compile(r"^#\s*([^:]+?)\s*:\s*(.*?)\s*$")
+
+def build_rows(notes, freq_labels, qpulse, speed, power, li):
+    # notes: one tab's sorted (r, c, text) triples
+    # Everything but the note and Q-pulse is constant for the whole export
+    desc_prefix = f" (Spd: {speed} - Pwr: {power} - LI: {li} - Qp: "
+    desc_suffix = ")"
+
+    rows = []
+    append = rows.append
+    for r, c, text in notes:
+        ns = str(qpulse[c])
+        # Updated Desc. now includes Q-pulse (Qp)
+        append((text + desc_prefix + ns + desc_suffix, text, freq_labels[r], power, ns, li))
+    return rows
+
+# CSVs repeat the same ~20 freq / Q-pulse strings, so parse each only once
+@lru_cache(maxsize=None)
+def _parse_freq(s):
+    return round(float(s), 1)
+
+@lru_cache(maxsize=None)
+def _parse_qpulse(s):
+    return round(float(s))
+
+def parse_rows(rows, freq_index, q1_index, q2_index):
+    # Yields ((tab, r, c), text) for each row that lands on the current grids
+    for row in rows:
+        # Short rows come back from DictReader with None for the missing fields
+        text = (row.get("Sub-layer name") or "").strip()
+        if not text:
+            continue
+
+        try:
+            r = freq_index.get(_parse_freq((row.get("Freq.") or "").strip()))
+            ns = _parse_qpulse((row.get("Q-pulse") or "").strip())
+        except (ValueError, OverflowError):
+            continue
+        if r is None:
+            continue
+
+        tab = 1
+        c = q1_index.get(ns)
+        if c is None:
+            tab = 2
+            c = q2_index.get(ns)
+            if c is None:
+                continue
+
+        yield (tab, r, c), text
 
 class LaserGridApp(tk.Tk):
     def __init__(self):
@@ -84,9 +186,19 @@ class LaserGridApp(tk.Tk):
         self.title("Laser Test Grid - Range Selector & CSV")
         self.geometry("1500x1200")
 
-        self.notes = {}
+        # notes_arr[tab - 1][r][c] holds the note text (or None);
+        # _notes_by_tab[tab - 1] lists that tab's filled (r, c) cells in order
+        self.notes_arr = [[], []]
+        self._notes_by_tab = ([], [])
         self.buttons = {}
+        self.canvases = {}
+        self.grid_axes = {}
+        self._item_to_key = {}      # canvas -> {item id: (tab, r, c)}
         self.current_freq_labels = []
+        self._freq_values = []
+        self._freq_index = {}
+        self._q1_index = {}
+        self._q2_index = {}
         self.current_qpulse1 = []
         self.current_qpulse2 = []
 
@@ -108,6 +220,7 @@ class LaserGridApp(tk.Tk):
         self.create_notebook_and_grids()
         self.create_controls_and_params()
         self.create_range_inputs()
+        self.create_tooltip()
 
         self.apply_ranges(silent=True)
 
@@ -116,6 +229,17 @@ class LaserGridApp(tk.Tk):
         self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
         self.tab1_frame = None
         self.tab2_frame = None
+        self._tab2_built = False
+
+    def create_tooltip(self):
+        # One shared tooltip window for every cell; shown after a short hover
+        self._tooltip = tk.Toplevel(self)
+        self._tooltip.withdraw()
+        self._tooltip.wm_overrideredirect(True)
+        self._tooltip_label = tk.Label(self._tooltip, justify="left", background="#ffffe0",
+                                       relief="solid", borderwidth=1, font=("Arial", 8))
+        self._tooltip_label.pack(ipadx=4, ipady=2)
+        self._tooltip_job = None
 
     def create_controls_and_params(self):
         frame = ttk.LabelFrame(self, text="Controls & Global Parameters", padding=10)
@@ -195,10 +319,10 @@ class LaserGridApp(tk.Tk):
         ttk.Label(row, text="End:").pack(side='left', padx=5)
         ttk.Entry(row, textvariable=self.q2_end_var, width=12).pack(side='left', padx=5)
 
-        ttk.Button(frame, text="Apply Ranges (clears notes)", command=self.apply_ranges).pack(pady=10)
+        ttk.Button(frame, text="Apply Ranges", command=self.apply_ranges).pack(pady=10)
 
     def apply_ranges(self, silent=False):
-        if not silent and not messagebox.askyesno("Confirm", "Apply new ranges? This will clear all current notes."):
+        if not silent and not messagebox.askyesno("Confirm", "Apply new ranges? Notes outside the new ranges will be cleared."):
             return
 
         try:
@@ -211,7 +335,9 @@ class LaserGridApp(tk.Tk):
 
             num_steps = 20
             f_step = (f_start - f_end) / (num_steps - 1) if num_steps > 1 else 0
-            self.current_freq_labels = [f"{f_start - i * f_step:.1f}" for i in range(num_steps)]
+            freqs = [f_start - i * f_step for i in range(num_steps)]
+            self.current_freq_labels = list(map("{:.1f}".format, freqs))
+            self._freq_values = [round(f, 1) for f in freqs]
 
             q1_step = max(1, (q1_end - q1_start) // (num_steps - 1)) if num_steps > 1 else 1
             q2_step = max(1, (q2_end - q2_start) // (num_steps - 1)) if num_steps > 1 else 1
@@ -221,62 +347,243 @@ class LaserGridApp(tk.Tk):
 
         except Exception as e:
             messagebox.showerror("Invalid Range", f"Error: {str(e)}\nUsing defaults.")
-            self.current_freq_labels = [f"{3800.0 - i*190:.1f}" for i in range(20)]
-            self.current_qpulse1 = list(range(1,21))
-            self.current_qpulse2 = list(range(21,41))
-            return
-
-        if self.tab1_frame: self.tab1_frame.destroy()
-        if self.tab2_frame: self.tab2_frame.destroy()
-
-        self.tab1_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.tab1_frame, text=f'Grid 1: {q1_start}–{q1_end} ns')
-        self.create_grid(self.tab1_frame, 1, self.current_freq_labels, self.current_qpulse1)
-
-        self.tab2_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.tab2_frame, text=f'Grid 2: {q2_start}–{q2_end} ns')
-        self.create_grid(self.tab2_frame, 2, self.current_freq_labels, self.current_qpulse2)
+            freqs = [3800.0 - i*190 for i in range(20)]
+            self.current_freq_labels = list(map("{:.1f}".format, freqs))
+            self._freq_values = freqs
+            q1_start, q1_end, q2_start, q2_end = 1, 20, 21, 40
+            self.current_qpulse1 = list(range(q1_start, q1_end + 1))
+            self.current_qpulse2 = list(range(q2_start, q2_end + 1))
+            # Fall through: the grids and note arrays must follow the default axes too
+            silent = True
+
+        self._index_axes()
+
+        tab1_text = f'Grid 1: {q1_start}–{q1_end} ns'
+        tab2_text = f'Grid 2: {q2_start}–{q2_end} ns'
+        if self.tab1_frame is None:
+            self.tab1_frame = ttk.Frame(self.notebook)
+            self.notebook.add(self.tab1_frame, text=tab1_text)
+            self.create_grid(self.tab1_frame, 1, self.current_freq_labels, self.current_qpulse1)
+
+            # Grid 2 stays an empty placeholder until its tab is first selected
+            self.tab2_frame = ttk.Frame(self.notebook)
+            self.notebook.add(self.tab2_frame, text=tab2_text)
+            self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+            self._alloc_notes()
+        else:
+            self.notebook.tab(self.tab1_frame, text=tab1_text)
+            self.notebook.tab(self.tab2_frame, text=tab2_text)
+
+            # Remember where each note sits by value so it can follow its cell
+            old_freq_labels, old_qpulse = self._notes_axes
+
+            # Unpaint old note cells before the grid geometry changes under them
+            old_notes = [(key, self._get_note(key)) for key in self._note_keys()]
+            self._clear_cells()
+
+            self.update_grid(1, self.current_freq_labels, self.current_qpulse1)
+            if self._tab2_built:
+                self.update_grid(2, self.current_freq_labels, self.current_qpulse2)
+
+            # Keep notes whose (freq, Q-pulse) still exists, remapped to their new cell
+            freq_pos = {f: i for i, f in enumerate(self.current_freq_labels)}
+            q_pos = {1: self._q1_index, 2: self._q2_index}
+            self._alloc_notes()
+            for (tab, r, c), text in old_notes:
+                new_r = freq_pos.get(old_freq_labels[r])
+                new_c = q_pos[tab].get(old_qpulse[tab][c])
+                if new_r is not None and new_c is not None:
+                    key = (tab, new_r, new_c)
+                    self._set_note(key, text)
+                    if key in self.buttons:
+                        self._paint_cell(key, text)
+            self.update_idletasks()
 
-        self.clear_all(silent=True)
         if not silent:
             messagebox.showinfo("Success", "Ranges applied.")
 
-    def create_grid(self, parent, tab_id, freq_labels, qpulse):
-        frame = tk.Frame(parent, padx=10, pady=10)
-        frame.pack(expand=True, fill='both')
-
-        tk.Label(frame, text="Q-Pulse →\nFreq ↓", font=("Arial", 10, "bold")).grid(row=0, column=0, padx=5, pady=5)
-
-        for col, val in enumerate(qpulse, 1):
-            tk.Label(frame, text=str(val), width=6, relief="ridge", bg="#e0e0e0").grid(row=0, column=col)
-
-        for row, freq in enumerate(freq_labels, 1):
-            tk.Label(frame, text=freq, width=10, anchor="e", relief="ridge", bg="#f0f0f0").grid(row=row, column=0)
+    def _on_tab_changed(self, event=None):
+        if self._tab2_built or self.notebook.index("current") != self.notebook.index(self.tab2_frame):
+            return
+        self._tab2_built = True
+        self.create_grid(self.tab2_frame, 2, self.current_freq_labels, self.current_qpulse2)
+        for r, c in self._notes_by_tab[1]:
+            self._paint_cell((2, r, c), self.notes_arr[1][r][c])
+
+    def _index_axes(self):
+        # Axis value -> grid position, for resolving CSV rows
+        self._freq_index = {}
+        for i, f in enumerate(self._freq_values):
+            self._freq_index.setdefault(f, i)
+        self._q1_index = {v: i for i, v in enumerate(self.current_qpulse1)}
+        self._q2_index = {v: i for i, v in enumerate(self.current_qpulse2)}
+
+    def _alloc_notes(self):
+        cols = max(len(self.current_qpulse1), len(self.current_qpulse2))
+        self.notes_arr = [[[None] * cols for _ in self.current_freq_labels] for _ in range(2)]
+        self._notes_by_tab = ([], [])
+        # Axes the note positions refer to, independent of which canvases exist
+        self._notes_axes = (self.current_freq_labels, {1: self.current_qpulse1, 2: self.current_qpulse2})
+
+    def _get_note(self, key):
+        tab, r, c = key
+        return self.notes_arr[tab - 1][r][c]
+
+    def _set_note(self, key, text):
+        tab, r, c = key
+        cells = self.notes_arr[tab - 1][r]
+        filled = self._notes_by_tab[tab - 1]
+        if text:
+            if cells[c] is None:
+                bisect.insort(filled, (r, c))
+            cells[c] = text
+        elif cells[c] is not None:
+            cells[c] = None
+            del filled[bisect.bisect_left(filled, (r, c))]
+
+    def _note_keys(self):
+        # Filled (tab, r, c) keys, in sorted order
+        for tab, filled in enumerate(self._notes_by_tab, 1):
+            for r, c in filled:
+                yield (tab, r, c)
 
-            for col, qval in enumerate(qpulse, 1):
-                key = (tab_id, row-1, col-1)
-                btn = tk.Button(frame, text=" ", width=8, height=1, bg="white", relief="groove", bd=1,
-                                font=("Arial", 8), command=lambda k=key: self.edit_note(k))
-                btn.grid(row=row, column=col, padx=1, pady=1)
-                self.buttons[key] = btn
+    def create_grid(self, parent, tab_id, freq_labels, qpulse):
+        canvas = tk.Canvas(parent, highlightthickness=0)
+        canvas.pack(expand=True, padx=10, pady=10)
+        self.canvases[tab_id] = canvas
+        self.grid_axes[tab_id] = ([], [])
+        self._item_to_key[canvas] = {}
+
+        canvas.create_text(HEADER_W / 2, HEADER_H / 2, text="Q-Pulse →\nFreq ↓", font=("Arial", 10, "bold"))
+        canvas.tag_bind("cell", "<Button-1>", self._on_cell_click)
+        canvas.tag_bind("cell", "<Enter>", self._schedule_tooltip)
+        canvas.tag_bind("cell", "<Leave>", self._hide_tooltip)
+
+        self.update_grid(tab_id, freq_labels, qpulse)
+
+    def update_grid(self, tab_id, freq_labels, qpulse):
+        # Adds/deletes rows and columns beyond the old extent; relabels headers whose value changed
+        canvas = self.canvases[tab_id]
+        old_freqs, old_qpulse = self.grid_axes[tab_id]
+        keep_rows = min(len(old_freqs), len(freq_labels))
+        keep_cols = min(len(old_qpulse), len(qpulse))
+
+        # Drop rows/columns past the new extent
+        for row in range(keep_rows, len(old_freqs)):
+            canvas.delete(f"row:{row}")
+            for col in range(len(old_qpulse)):
+                self._forget_cell(canvas, (tab_id, row, col))
+        for col in range(keep_cols, len(old_qpulse)):
+            canvas.delete(f"col:{col}")
+            for row in range(keep_rows):
+                self._forget_cell(canvas, (tab_id, row, col))
+
+        # Relabel surviving headers whose value moved
+        for row in range(keep_rows):
+            if old_freqs[row] != freq_labels[row]:
+                canvas.itemconfig(f"row_label:{row}", text=freq_labels[row])
+        for col in range(keep_cols):
+            if old_qpulse[col] != qpulse[col]:
+                canvas.itemconfig(f"col_label:{col}", text=str(qpulse[col]))
+
+        # Draw whatever is new
+        for col in range(keep_cols, len(qpulse)):
+            x = HEADER_W + col * CELL_W
+            tags = (f"col:{col}",)
+            canvas.create_rectangle(x, 0, x + CELL_W, HEADER_H, fill="#e0e0e0", outline="#a0a0a0", tags=tags)
+            canvas.create_text(x + CELL_W / 2, HEADER_H / 2, text=str(qpulse[col]), tags=tags + (f"col_label:{col}",))
+            for row in range(keep_rows):
+                self._create_cell(canvas, tab_id, row, col)
+
+        for row in range(keep_rows, len(freq_labels)):
+            y = HEADER_H + row * CELL_H
+            tags = (f"row:{row}",)
+            canvas.create_rectangle(0, y, HEADER_W, y + CELL_H, fill="#f0f0f0", outline="#a0a0a0", tags=tags)
+            canvas.create_text(HEADER_W - 6, y + CELL_H / 2, text=freq_labels[row], anchor="e",
+                               tags=tags + (f"row_label:{row}",))
+            for col in range(len(qpulse)):
+                self._create_cell(canvas, tab_id, row, col)
+
+        canvas.config(width=HEADER_W + len(qpulse) * CELL_W + 1,
+                      height=HEADER_H + len(freq_labels) * CELL_H + 1)
+        self.grid_axes[tab_id] = (list(freq_labels), list(qpulse))
+
+    def _create_cell(self, canvas, tab_id, row, col):
+        x = HEADER_W + col * CELL_W
+        y = HEADER_H + row * CELL_H
+        tags = ("cell", f"row:{row}", f"col:{col}")
+        rect_id = canvas.create_rectangle(x, y, x + CELL_W, y + CELL_H, fill="white",
+                                          outline="#c0c0c0", tags=tags + ("cell_bg",))
+        text_id = canvas.create_text(x + CELL_W / 2, y + CELL_H / 2, text="", font=("Arial", 8),
+                                     tags=tags + ("note_text",))
+        key = (tab_id, row, col)
+        self.buttons[key] = (rect_id, text_id)
+        item_to_key = self._item_to_key[canvas]
+        item_to_key[rect_id] = key
+        item_to_key[text_id] = key
+
+    def _forget_cell(self, canvas, key):
+        item_to_key = self._item_to_key[canvas]
+        for item in self.buttons.pop(key, ()):
+            item_to_key.pop(item, None)
+
+    def _key_at(self, canvas, x, y):
+        item = canvas.find_closest(canvas.canvasx(x), canvas.canvasy(y))
+        return self._item_to_key[canvas].get(item[0]) if item else None
+
+    def _on_cell_click(self, event):
+        self._hide_tooltip()
+        key = self._key_at(event.widget, event.x, event.y)
+        if key is not None:
+            self.edit_note(key)
+
+    def _schedule_tooltip(self, event):
+        self._hide_tooltip()
+        self._tooltip_job = self.after(400, self._show_tooltip_for_item, event.widget,
+                                       event.x, event.y, event.x_root, event.y_root)
+
+    def _show_tooltip_for_item(self, canvas, x, y, x_root, y_root):
+        self._tooltip_job = None
+        key = self._key_at(canvas, x, y)
+        text = self._get_note(key) if key is not None else None
+        if not text:
+            return
+        self._tooltip_label.config(text=text)
+        self._tooltip.geometry(f"+{x_root + 15}+{y_root + 15}")
+        self._tooltip.deiconify()
+        self._tooltip.lift()
+
+    def _hide_tooltip(self, event=None):
+        if self._tooltip_job is not None:
+            self.after_cancel(self._tooltip_job)
+            self._tooltip_job = None
+        self._tooltip.withdraw()
+
+    def _paint_cell(self, key, text):
+        rect_id, text_id = self.buttons[key]
+        canvas = self.canvases[key[0]]
+        if text:
+            shown = text if len(text) <= CELL_TEXT_LEN else text[:CELL_TEXT_LEN - 1] + "…"
+            canvas.itemconfig(rect_id, fill="#90EE90")
+            canvas.itemconfig(text_id, text=shown, fill="black", font=("Arial", 8, "bold"))
+        else:
+            canvas.itemconfig(rect_id, fill="white")
+            canvas.itemconfig(text_id, text="", fill="black", font=("Arial", 8))
 
-        for i in range(len(qpulse) + 1):
-            frame.columnconfigure(i, weight=1)
-        for i in range(len(freq_labels) + 1):
-            frame.rowconfigure(i, weight=1)
+    def _clear_cells(self):
+        # One itemconfig per tag resets every cell on a canvas in a single call
+        for canvas in self.canvases.values():
+            canvas.itemconfig("cell_bg", fill="white")
+            canvas.itemconfig("note_text", text="", font=("Arial", 8))
 
     def edit_note(self, key):
-        current = self.notes.get(key, "")
+        current = self._get_note(key) or ""
         new_text = simpledialog.askstring("Note", "Enter note/rating:", initialvalue=current, parent=self)
         if new_text is None:
             return
         new_text = new_text.strip()[:40]
-        if new_text:
-            self.notes[key] = new_text
-            self.buttons[key].config(text=new_text, bg="#90EE90", fg="black", font=("Arial", 8, "bold"))
-        else:
-            self.notes.pop(key, None)
-            self.buttons[key].config(text=" ", bg="white", fg="black", font=("Arial", 8))
+        self._set_note(key, new_text)
+        self._paint_cell(key, new_text)
 
     def get_params_dict(self):
         return {
@@ -287,8 +594,24 @@ class LaserGridApp(tk.Tk):
             "passes": self.param_entries["Number of passes"].get().strip(),
         }
 
+    def _snapshot_vars(self):
+        # Range and scan-setting values, read once per operation
+        return {
+            "freq_start": self.freq_start_var.get(),
+            "freq_end": self.freq_end_var.get(),
+            "q1_start": self.q1_start_var.get(),
+            "q1_end": self.q1_end_var.get(),
+            "q2_start": self.q2_start_var.get(),
+            "q2_end": self.q2_end_var.get(),
+            "mode": self.mode_var.get(),
+            "angle_inc": self.angle_inc_var.get(),
+            "auto_rotate": self.auto_rotate_var.get(),
+            "bi_dir": "Yes" if self.bi_dir_var.get() else "No",
+            "cross_hatch": "Yes" if self.cross_hatch_var.get() else "No",
+        }
+
     def export_to_csv(self):
-        if not self.notes:
+        if not any(self._notes_by_tab):
             messagebox.showinfo("Export", "No selections to export.")
             return
 
@@ -302,43 +625,21 @@ class LaserGridApp(tk.Tk):
             return
 
         rows = []
-        for (tab, r, c), text in sorted(self.notes.items()):
-            freq = self.current_freq_labels[r]
-            ns = self.current_qpulse1[c] if tab == 1 else self.current_qpulse2[c]
-
-            # Updated Desc. now includes Q-pulse (Qp)
-            desc = f"{text} (Spd: {params['speed']} - Pwr: {params['power']} - LI: {params['li']} - Qp: {ns})"
-
-            rows.append({
-                "Desc.": desc,
-                "Sub-layer name": text,
-                "Freq.": freq,
-                "Max power": params["power"],
-                "Q-pulse": str(ns),
-                "LI": params["li"]
-            })
+        for tab, qpulse in ((1, self.current_qpulse1), (2, self.current_qpulse2)):
+            filled = self._notes_by_tab[tab - 1]
+            if not filled:
+                continue
+            tab_notes = self.notes_arr[tab - 1]
+            rows += build_rows([(r, c, tab_notes[r][c]) for r, c in filled], self.current_freq_labels,
+                               qpulse, params["speed"], params["power"], params["li"])
 
         try:
             with open(file_path, 'w', newline='', encoding='utf-8') as f:
                 # Metadata at top (unchanged)
-                f.write(f"# Title: {params['title']}\n")
-                f.write(f"# Freq Start: {self.freq_start_var.get()}\n")
-                f.write(f"# Freq End: {self.freq_end_var.get()}\n")
-                f.write(f"# Q1 Start: {self.q1_start_var.get()}\n")
-                f.write(f"# Q1 End: {self.q1_end_var.get()}\n")
-                f.write(f"# Q2 Start: {self.q2_start_var.get()}\n")
-                f.write(f"# Q2 End: {self.q2_end_var.get()}\n")
-                f.write(f"# Mode: {self.mode_var.get()}\n")
-                f.write(f"# Angle Increment: {self.angle_inc_var.get()}\n")
-                f.write(f"# Auto Rotate: {self.auto_rotate_var.get()}\n")
-                f.write(f"# Bi-directional: {'Yes' if self.bi_dir_var.get() else 'No'}\n")
-                f.write(f"# Cross-hatch: {'Yes' if self.cross_hatch_var.get() else 'No'}\n")
-                f.write("\n")
-
-                writer = csv.DictWriter(f, fieldnames=[
-                    "Desc.", "Sub-layer name", "Freq.", "Max power", "Q-pulse", "LI"
-                ])
-                writer.writeheader()
+                f.write(_META_TPL.format_map(dict(self._snapshot_vars(), title=params["title"])))
+
+                writer = csv.writer(f)
+                writer.writerow(CSV_FIELDS)
                 writer.writerows(rows)
 
             messagebox.showinfo("Success", f"Exported {len(rows)} rows to:\n{file_path}")
@@ -351,15 +652,22 @@ class LaserGridApp(tk.Tk):
             return
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            # Parse metadata
+            # Single pass: peel the "#" metadata block, then stream the rest into the reader
             metadata = {}
-            for line in lines:
-                if line.startswith("#") and ":" in line:
-                    key, val = line[1:].strip().split(":", 1)
-                    metadata[key.strip()] = val.strip()
+            with open(file_path, 'r', encoding='utf-8') as f:
+                first_data_line = None
+                for line in f:
+                    if line.startswith("#"):
+                        m = _META_RE.match(line)
+                        if m:
+                            metadata[m.group(1)] = m.group(2)
+                    elif line.strip():
+                        first_data_line = line
+                        break
+
+                loaded_rows = []
+                if first_data_line is not None:
+                    loaded_rows = list(csv.DictReader(itertools.chain([first_data_line], f)))
 
             # Restore ranges
             for key, var in [
@@ -386,18 +694,13 @@ class LaserGridApp(tk.Tk):
                 self.cross_hatch_var.set(metadata["Cross-hatch"] == "Yes")
 
             self.apply_ranges(silent=True)
-
-            # Parse data
-            data_lines = [line for line in lines if not line.startswith("#") and line.strip()]
-            reader = csv.DictReader(data_lines)
-            loaded_rows = list(reader)
+            # apply_ranges keeps notes that still fit; a loaded file must never merge with them
+            self.clear_all(silent=True)
 
             if not loaded_rows:
                 messagebox.showinfo("Load", "No data rows found.")
                 return
 
-            self.clear_all(silent=True)
-
             # Restore basic params from Desc.
             if loaded_rows:
                 first = loaded_rows[0]
@@ -415,40 +718,12 @@ class LaserGridApp(tk.Tk):
 
             # Restore selections
             loaded_count = 0
-            for row in loaded_rows:
-                text = row.get("Sub-layer name", "").strip()
-                if not text:
-                    continue
-
-                freq_str = row.get("Freq.", "").strip()
-                q_str = row.get("Q-pulse", "").strip()
-
-                try:
-                    saved_freq = round(float(freq_str), 1)
-                    r = next((i for i, f in enumerate(self.current_freq_labels) if round(float(f), 1) == saved_freq), None)
-                    if r is None:
-                        continue
-                except:
-                    continue
-
-                try:
-                    ns = round(float(q_str))
-                    if ns in self.current_qpulse1:
-                        tab = 1
-                        c = self.current_qpulse1.index(ns)
-                    elif ns in self.current_qpulse2:
-                        tab = 2
-                        c = self.current_qpulse2.index(ns)
-                    else:
-                        continue
-                except:
-                    continue
-
-                key = (tab, r, c)
+            for key, text in parse_rows(loaded_rows, self._freq_index, self._q1_index, self._q2_index):
+                self._set_note(key, text)
                 if key in self.buttons:
-                    self.notes[key] = text
-                    self.buttons[key].config(text=text, bg="#90EE90", fg="black", font=("Arial", 8, "bold"))
-                    loaded_count += 1
+                    self._paint_cell(key, text)
+                loaded_count += 1
+            self.update_idletasks()
 
             msg = f"Loaded {loaded_count} selections.\nRanges + scan settings restored."
             if "Title" in metadata:
@@ -462,50 +737,30 @@ class LaserGridApp(tk.Tk):
             messagebox.showerror("Load Error", f"Failed to load:\n{str(e)}")
 
     def show_all_notes(self):
-        lines = []
-        params = {
-            "title": self.title_entry.get().strip(),
-            "speed": self.param_entries["Speed (mm/s)"].get().strip(),
-            "power": self.param_entries["Max Power (%)"].get().strip(),
-            "li": self.param_entries["Line interval (mm)"].get().strip(),
-            "passes": self.param_entries["Number of passes"].get().strip(),
-        }
-
-        lines.append(f"Title: {params['title'] or '[empty]'}")
-        lines.append("Parameters:")
-        for k, v in params.items():
-            if k != "title":
-                lines.append(f"  {k}: {v or '[empty]'}")
-
-        lines.append("\nScan Settings:")
-        lines.append(f"  Mode: {self.mode_var.get()}")
-        lines.append(f"  Angle increment: {self.angle_inc_var.get()}°")
-        lines.append(f"  Auto-rotate: {self.auto_rotate_var.get()}°")
-        lines.append(f"  Bi-directional: {'Yes' if self.bi_dir_var.get() else 'No'}")
-        lines.append(f"  Cross-hatch: {'Yes' if self.cross_hatch_var.get() else 'No'}")
-
-        lines.append(f"\nRanges:")
-        lines.append(f"  Freq: {self.freq_start_var.get()} → {self.freq_end_var.get()}")
-        lines.append(f"  Q1: {self.q1_start_var.get()} → {self.q1_end_var.get()}")
-        lines.append(f"  Q2: {self.q2_start_var.get()} → {self.q2_end_var.get()}")
-
-        if self.notes:
-            lines.append("\nNotes:")
-            for (tab, r, c), text in sorted(self.notes.items()):
-                freq = self.current_freq_labels[r]
-                ns = self.current_qpulse1[c] if tab == 1 else self.current_qpulse2[c]
-                lines.append(f"  Grid {tab} | {freq} kHz | {ns} ns → {text}")
+        fields = {k: v or "[empty]" for k, v in self.get_params_dict().items()}
+        fields.update(self._snapshot_vars())
+        summary = _SUMMARY_TPL.format_map(fields)
+
+        if any(self._notes_by_tab):
+            freq_labels = self.current_freq_labels
+            qpulse = {1: self.current_qpulse1, 2: self.current_qpulse2}
+            notes_arr = self.notes_arr
+            summary += "\n\nNotes:\n" + "\n".join([
+                f"  Grid {tab} | {freq_labels[r]} kHz | {qpulse[tab][c]} ns → {notes_arr[tab - 1][r][c]}"
+                for tab, r, c in self._note_keys()
+            ])
         else:
-            lines.append("\nNo notes added yet.")
+            summary += "\n\nNo notes added yet."
 
-        messagebox.showinfo("Summary", "\n".join(lines))
+        messagebox.showinfo("Summary", summary)
 
     def clear_all(self, silent=False):
         if silent or messagebox.askyesno("Clear", "Remove all notes?"):
-            for key in list(self.notes.keys()):
-                if key in self.buttons:
-                    self.buttons[key].config(text=" ", bg="white", fg="black", font=("Arial", 8))
-            self.notes.clear()
+            for tab, r, c in self._note_keys():
+                self.notes_arr[tab - 1][r][c] = None
+            self._notes_by_tab = ([], [])
+            self._clear_cells()
+            self.update_idletasks()
 
 if __name__ == "__main__":
     app = LaserGridApp()
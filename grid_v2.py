@@ -13,6 +13,8 @@ import tkinter as tk
 from tkinter import ttk, simpledialog, messagebox, filedialog
 import csv
 import datetime
+import itertools
+import sys
 
 # ====================== CONFIGURATION ======================
 CONFIG = {
@@ -23,6 +25,11 @@ CONFIG = {
     "FONT_SIZE_TOOLTIP": 8,
     "FONT_SIZE_TITLE": 10,
 
+    "CELL_WIDTH": 80,                 # pixels
+    "CELL_HEIGHT": 26,
+    "HEADER_WIDTH": 100,              # row-label column
+    "HEADER_HEIGHT": 30,              # column-label row
+
     "COLOR_BG_EMPTY": "white",
     "COLOR_BG_NOTE": "#c8f7c5",       # light green
     "COLOR_BG_EDITING": "#FF8C00",    # orange
@@ -30,14 +37,16 @@ CONFIG = {
 
     "COLOR_HEADER_X": "#e8f4ff",
     "COLOR_HEADER_Y": "#f5f9ff",
+    "COLOR_GRID_LINE": "#b0b0b0",
 
     "COLOR_TOOLTIP_BG": "#ffffe0",
     "COLOR_TOOLTIP_BORDER": "black",
 
     # Behavior settings
     "MAX_NOTE_LENGTH": 512,
-    "DISPLAY_NOTE_LENGTH": 40,        # chars shown in cell + "..."
+    "DISPLAY_NOTE_LENGTH": 10,        # chars shown in cell + "..."
     "TOOLTIP_WRAP_LENGTH": 400,      # pixels
+    "EXPORT_BUFFER_SIZE": 1 << 20,    # bytes; whole export flushes in one write
 
     # Default grid counts
     "DEFAULT_X_COUNTS": 20,
@@ -53,45 +62,97 @@ CONFIG = {
 }
 # ===========================================================
 
-PARAMETERS = [
+# Interned so that comparisons against them (and against interned axis
+# selections) short-circuit on identity
+PARAMETERS = [sys.intern(p) for p in (
+    "Speed", "Power", "Frequency", "Line Interval", "Passes", "Q-Pulse"
+)]
+
+# Axis values of these are whole numbers; the rest use VALUE_FORMATS or "%.2f"
+INT_PARAMS = {"Speed", "Power", "Passes", "Q-Pulse"}
+VALUE_FORMATS = {"Line Interval": "%.4f", "Frequency": "%.1f"}
+
+# One bit per parameter, for cheap "is this an active axis?" tests
+PARAM_BIT = {p: 1 << i for i, p in enumerate(PARAMETERS)}
+
+# Column order of the exported CSV rows
+FIELDNAMES = (
+    "Note", "Tab", "X_Param", "X_Value", "Y_Param", "Y_Value", "Title",
     "Speed", "Power", "Frequency", "Line Interval", "Passes", "Q-Pulse"
+)
+
+# (label, parameter) pairs for the per-note title written on export
+TITLE_FIELDS = [
+    ("S", "Speed"), ("P", "Power"), ("F", "Frequency"),
+    ("QP", "Q-Pulse"), ("LI", "Line Interval"), ("Pass", "Passes")
 ]
 
 class ToolTip:
-    def __init__(self, widget, text):
+    # One window and label shared by every tip; created on first show, then
+    # only withdrawn and re-shown
+    _tw = None
+    _label = None
+
+    def __init__(self, widget, text, bind=True):
+        # With bind=False the owner drives show_tip/hide_tip and may retarget the tip
         self.widget = widget
         self.text = text
-        self.tip_window = None
-        self.widget.bind("<Enter>", self.show_tip)
-        self.widget.bind("<Leave>", self.hide_tip)
+        # Extra (x, y) shift from the widget's origin, e.g. a cell's position on a Canvas
+        self.offset = (0, 0)
+        self._showing = False
+        if bind:
+            self.widget.bind("<Enter>", self.show_tip)
+            self.widget.bind("<Leave>", self.hide_tip)
 
     def show_tip(self, event=None):
-        if self.tip_window or not self.text:
+        if self._showing or not self.text:
             return
-        x = self.widget.winfo_rootx() + 25
-        y = self.widget.winfo_rooty() + 25
-        self.tip_window = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(tw, text=self.text, justify="left",
-                         background=CONFIG["COLOR_TOOLTIP_BG"],
-                         relief="solid", borderwidth=1,
-                         font=(CONFIG["FONT_FAMILY"], CONFIG["FONT_SIZE_TOOLTIP"]),
-                         wraplength=CONFIG["TOOLTIP_WRAP_LENGTH"])
-        label.pack(ipadx=6, ipady=4)
+        if event is not None:
+            # The event already carries the widget's screen position
+            x, y = event.x_root - event.x, event.y_root - event.y
+        else:
+            x, y = self.widget.winfo_rootx(), self.widget.winfo_rooty()
+        x += 25 + self.offset[0]
+        y += 25 + self.offset[1]
+        if ToolTip._tw is None:
+            ToolTip._tw = tw = tk.Toplevel(self.widget.winfo_toplevel())
+            tw.wm_overrideredirect(True)
+            ToolTip._label = tk.Label(tw, justify="left",
+                                      background=CONFIG["COLOR_TOOLTIP_BG"],
+                                      relief="solid", borderwidth=1,
+                                      font=(CONFIG["FONT_FAMILY"], CONFIG["FONT_SIZE_TOOLTIP"]),
+                                      wraplength=CONFIG["TOOLTIP_WRAP_LENGTH"])
+            ToolTip._label.pack(ipadx=6, ipady=4)
+        ToolTip._label.config(text=self.text)
+        ToolTip._tw.wm_geometry(f"+{x}+{y}")
+        ToolTip._tw.deiconify()
+        self._showing = True
 
     def hide_tip(self, event=None):
-        if self.tip_window:
-            self.tip_window.destroy()
-            self.tip_window = None
+        if self._showing:
+            ToolTip._tw.withdraw()
+            self._showing = False
 
 class LaserGridApp(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("Laser Test Grid - Configurable X/Y Axes v2.0")
         self.geometry("1800x1150")
-        self.notes = {}
+        # note_arr[tab_id][row][col] holds the note text, or None for an empty cell
+        self.note_arr = {}
         self.buttons = {}
+        self._cell_font = (CONFIG["FONT_FAMILY"], CONFIG["FONT_SIZE_BUTTON"])
+        self._cell_font_bold = self._cell_font + ("bold",)
+        # Grid canvas -> tab_id, so one handler serves every grid
+        self._canvas_tabs = {}
+        # header_items[tab_id] = (canvas, x header text ids, y header text ids)
+        self._header_items = {}
+        # (x_param, y_param, x_counts, y_counts, mode) of the grids currently built
+        self._last_shape = None
+        # Pending after_idle job for _do_refresh_global_states, if any
+        self._refresh_job = None
+        # Shared by every grid cell, created on first hover over a long note
+        self._tooltip = None
 
         self.x_axis_var = tk.StringVar(value="Q-Pulse")
         self.y_axis_var = tk.StringVar(value="Frequency")
@@ -137,9 +198,19 @@ class LaserGridApp(tk.Tk):
         return defaults.get(param, "200")
 
     def _update_global_field_states(self, *args):
-        active_axes = {self.x_axis_var.get(), self.y_axis_var.get()}
+        # Coalesce bursts of axis writes (e.g. both axes during a load) into one refresh
+        if self._refresh_job is None:
+            self._refresh_job = self.after_idle(self._do_refresh_global_states)
+
+    def _do_refresh_global_states(self):
+        # A direct call makes any queued refresh redundant
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
+        mask = PARAM_BIT.get(self.x_axis_var.get(), 0) | PARAM_BIT.get(self.y_axis_var.get(), 0)
         for param, entry in self.global_entries.items():
-            if param != "Title" and param in active_axes:
+            # "Title" has no bit, so it is never disabled
+            if PARAM_BIT.get(param, 0) & mask:
                 entry.configure(state='disabled')
             else:
                 entry.configure(state='normal')
@@ -157,9 +228,10 @@ class LaserGridApp(tk.Tk):
         lines.append(f"  X counts: {self.x_counts_var.get()} → {len(self.current_values_x)} values")
         lines.append(f"  Y counts: {self.y_counts_var.get()} → {len(self.current_values_y)} values")
 
-        if self.notes:
-            lines.append(f"\n{len(self.notes)} Notes:")
-            for (tab, r, c), text in sorted(self.notes.items()):
+        notes = list(self._iter_notes())
+        if notes:
+            lines.append(f"\n{len(notes)} Notes:")
+            for tab, r, c, text in notes:
                 x_val = self.current_values_x[c]
                 y_val = self.current_values_y[r]
                 prefix = f"Grid {tab}: " if tab > 0 else ""
@@ -170,7 +242,8 @@ class LaserGridApp(tk.Tk):
         messagebox.showinfo("Summary", "\n".join(lines))
 
     def export_to_csv(self):
-        if not self.notes:
+        count = sum(1 for _ in self._iter_notes())
+        if not count:
             messagebox.showinfo("Export", "No notes to export.")
             return
 
@@ -185,66 +258,9 @@ class LaserGridApp(tk.Tk):
         if not file_path:
             return
 
-        rows = []
-        for (tab, r, c), note_text in sorted(self.notes.items()):
-            # Get cell-specific values
-            x_value = self.current_values_x[c]
-            y_value = self.current_values_y[r]
-
-            # Create settings dictionary with cell-specific overrides
-            cell_settings = globals_dict.copy()
-
-            # Apply the axis values that were varied
-            if self.current_x_param in cell_settings:
-                cell_settings[self.current_x_param] = x_value
-            if self.current_y_param in cell_settings:
-                cell_settings[self.current_y_param] = y_value
-
-            # Format values nicely (keep original precision where it matters)
-            def fmt(val):
-                if isinstance(val, str):
-                    try:
-                        f = float(val)
-                        if f.is_integer():
-                            return str(int(f))
-                        elif abs(f) < 1:
-                            return f"{f:.4f}"
-                        else:
-                            return f"{f:.1f}"
-                    except:
-                        return val
-                return str(val)
-
-            # Build the exact format you requested
-            dynamic_title = (
-                f"{note_text} "
-                f"(S:{fmt(cell_settings.get('Speed', '?'))} "
-                f"P:{fmt(cell_settings.get('Power', '?'))} "
-                f"F:{fmt(cell_settings.get('Frequency', '?'))} "
-                f"QP:{fmt(cell_settings.get('Q-Pulse', '?'))} "
-                f"LI:{fmt(cell_settings.get('Line Interval', '?'))} "
-                f"Pass:{fmt(cell_settings.get('Passes', '?'))})"
-            ).strip()
-
-            row = {
-                "Note": note_text,
-                "Tab": tab,
-                "X_Param": self.current_x_param,
-                "X_Value": x_value,
-                "Y_Param": self.current_y_param,
-                "Y_Value": y_value,
-                "Title": dynamic_title,
-                "Speed": cell_settings.get("Speed", ""),
-                "Power": cell_settings.get("Power", ""),
-                "Frequency": cell_settings.get("Frequency", ""),
-                "Line Interval": cell_settings.get("Line Interval", ""),
-                "Passes": cell_settings.get("Passes", ""),
-                "Q-Pulse": cell_settings.get("Q-Pulse", "")
-            }
-            rows.append(row)
-
         try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            with open(file_path, 'w', newline='', encoding='utf-8',
+                      buffering=CONFIG["EXPORT_BUFFER_SIZE"]) as f:
                 today = datetime.date.today().strftime("%Y-%m-%d")
                 f.write("# Laser Test Grid Export - Metadata\n")
                 f.write(f"# Date: {today}\n")
@@ -264,14 +280,64 @@ class LaserGridApp(tk.Tk):
                     f.write(f"#   {param}: {value}\n")
                 f.write("\n")
 
-                writer = csv.DictWriter(f, fieldnames=rows[0].keys(), delimiter='|')
+                writer = csv.DictWriter(f, fieldnames=FIELDNAMES, delimiter='|')
                 writer.writeheader()
-                writer.writerows(rows)
+                writer.writerows(self._iter_export_rows(globals_dict))
 
-            messagebox.showinfo("Success", f"Exported {len(rows)} rows + metadata (pipe delimited)")
+            messagebox.showinfo("Success", f"Exported {count} rows + metadata (pipe delimited)")
         except Exception as e:
             messagebox.showerror("Export Error", str(e))
 
+    def _iter_export_rows(self, globals_dict):
+        # One FIELDNAMES row dict per note
+        x_param, y_param = self.current_x_param, self.current_y_param
+
+        # Format values nicely (keep original precision where it matters)
+        def fmt(val):
+            if isinstance(val, str):
+                try:
+                    f = float(val)
+                    if f.is_integer():
+                        return str(int(f))
+                    elif abs(f) < 1:
+                        return f"{f:.4f}"
+                    else:
+                        return f"{f:.1f}"
+                except:
+                    return val
+            return str(val)
+
+        # Build the exact format you requested. Only the two axis params vary per
+        # row, so the other globals are formatted once into the template.
+        title_parts = []
+        for label, param in TITLE_FIELDS:
+            if param == x_param:
+                title_parts.append(f"{label}:{{x}}")
+            elif param == y_param:
+                title_parts.append(f"{label}:{{y}}")
+            else:
+                value = fmt(globals_dict.get(param, '?'))
+                title_parts.append(f"{label}:" + value.replace("{", "{{").replace("}", "}}"))
+        title_template = "{note} (" + " ".join(title_parts) + ")"
+
+        # Columns shared by every row; the axis params are overridden per cell
+        base = {param: globals_dict.get(param, "") for param in PARAMETERS}
+        base["X_Param"] = x_param
+        base["Y_Param"] = y_param
+
+        for tab, r, c, note_text in self._iter_notes():
+            x_value = self.current_values_x[c]
+            y_value = self.current_values_y[r]
+            row = base.copy()
+            row[x_param] = x_value
+            row[y_param] = y_value
+            row["Note"] = note_text
+            row["Tab"] = tab
+            row["X_Value"] = x_value
+            row["Y_Value"] = y_value
+            row["Title"] = title_template.format(note=note_text, x=fmt(x_value), y=fmt(y_value)).strip()
+            yield row
+
     def load_from_csv(self):
         file_path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv")])
         if not file_path:
@@ -279,83 +345,84 @@ class LaserGridApp(tk.Tk):
 
         try:
             metadata = {}
-            data_lines = []
 
             with open(file_path, 'r', encoding='utf-8') as f:
+                # Metadata comes first; stop at the CSV header and stream the rest
+                first = None
                 for line in f:
-                    line = line.strip()
-                    if line.startswith('#') and ':' in line:
-                        key, val = line[1:].split(':', 1)
-                        key = key.strip()
-                        val = val.strip()
-                        metadata[key] = val
-                    elif line and not line.startswith('#'):
-                        data_lines.append(line)
-
-            if "X_Axis" in metadata:
-                self.x_axis_var.set(metadata["X_Axis"])
-            if "Y_Axis" in metadata:
-                self.y_axis_var.set(metadata["Y_Axis"])
-            if "Mode" in metadata:
-                self.qpulse_mode.set("Split" if metadata["Mode"] == "Split" else "Single")
-            if "X_counts" in metadata:
-                self.x_counts_var.set(metadata["X_counts"])
-            if "Y_counts" in metadata:
-                self.y_counts_var.set(metadata["Y_counts"])
-
-            for param in PARAMETERS:
-                start_key = f"{param}_start"
-                end_key = f"{param}_end"
-                if start_key in metadata:
-                    self.ranges[param]["start"].set(metadata[start_key])
-                if end_key in metadata:
-                    self.ranges[param]["end"].set(metadata[end_key])
-
-            self.apply_ranges(silent=True)
-
-            for param in PARAMETERS + ["Title"]:
-                if param in metadata and param in self.global_entries:
-                    self.global_entries[param].delete(0, tk.END)
-                    self.global_entries[param].insert(0, metadata[param])
-
-            self._update_global_field_states()
-
-            if not data_lines:
-                messagebox.showinfo("Load", "No data rows found, but metadata restored.")
-                return
-
-            reader = csv.DictReader(data_lines, delimiter='|')
-            rows = list(reader)
-
-            loaded = 0
-            self.clear_all(silent=True)
+                    stripped = line.strip()
+                    if stripped.startswith('#'):
+                        if ':' in stripped:
+                            key, val = stripped[1:].split(':', 1)
+                            metadata[key.strip()] = val.strip()
+                    elif stripped:
+                        first = line
+                        break
+
+                if "X_Axis" in metadata:
+                    self.x_axis_var.set(metadata["X_Axis"])
+                if "Y_Axis" in metadata:
+                    self.y_axis_var.set(metadata["Y_Axis"])
+                if "Mode" in metadata:
+                    self.qpulse_mode.set("Split" if metadata["Mode"] == "Split" else "Single")
+                if "X_counts" in metadata:
+                    self.x_counts_var.set(metadata["X_counts"])
+                if "Y_counts" in metadata:
+                    self.y_counts_var.set(metadata["Y_counts"])
 
-            for row in rows:
-                try:
-                    if row["X_Param"] != self.current_x_param or row["Y_Param"] != self.current_y_param:
+                for param in PARAMETERS:
+                    start_key = f"{param}_start"
+                    end_key = f"{param}_end"
+                    if start_key in metadata:
+                        self.ranges[param]["start"].set(metadata[start_key])
+                    if end_key in metadata:
+                        self.ranges[param]["end"].set(metadata[end_key])
+
+                self.apply_ranges(silent=True)
+
+                # Disabled entries ignore inserts, so settle the states for the new axes first.
+                # apply_ranges normally has; a queued refresh means it bailed out early.
+                if self._refresh_job is not None:
+                    self._do_refresh_global_states()
+                for param in PARAMETERS + ["Title"]:
+                    if param in metadata and param in self.global_entries:
+                        self.global_entries[param].delete(0, tk.END)
+                        self.global_entries[param].insert(0, metadata[param])
+
+                if first is None:
+                    messagebox.showinfo("Load", "No data rows found, but metadata restored.")
+                    return
+
+                reader = csv.DictReader(itertools.chain([first], f), delimiter='|')
+
+                loaded = 0
+                self.clear_all(silent=True)
+
+                # Built back to front so a repeated value keeps its first index
+                x_idx = {v: i for i, v in reversed(list(enumerate(self.current_values_x)))}
+                y_idx = {v: i for i, v in reversed(list(enumerate(self.current_values_y)))}
+
+                display_len, color_note = CONFIG["DISPLAY_NOTE_LENGTH"], CONFIG["COLOR_BG_NOTE"]
+
+                for row in reader:
+                    if row.get("X_Param") != self.current_x_param or row.get("Y_Param") != self.current_y_param:
                         continue
-                    x_val = row["X_Value"]
-                    y_val = row["Y_Value"]
-                    note = row.get("Note", "").strip()
-                    tab = int(row.get("Tab", "0"))
-
-                    c = next((i for i, v in enumerate(self.current_values_x) if str(v) == str(x_val)), None)
-                    r = next((i for i, v in enumerate(self.current_values_y) if str(v) == str(y_val)), None)
-
-                    if r is not None and c is not None:
-                        key = (tab, r, c)
-                        if key in self.buttons:
-                            self.notes[key] = note
-                            display_text = (note[:CONFIG["DISPLAY_NOTE_LENGTH"]] + "...") if len(note) > CONFIG["DISPLAY_NOTE_LENGTH"] else note
-                            self.buttons[key].config(text=display_text,
-                                                     bg=CONFIG["COLOR_BG_NOTE"],
-                                                     fg=CONFIG["COLOR_FG_TEXT"],
-                                                     font=(CONFIG["FONT_FAMILY"], CONFIG["FONT_SIZE_BUTTON"], "bold"))
-                            if len(note) > CONFIG["DISPLAY_NOTE_LENGTH"]:
-                                ToolTip(self.buttons[key], note)
-                            loaded += 1
-                except:
-                    continue
+                    c = x_idx.get(row.get("X_Value"))
+                    r = y_idx.get(row.get("Y_Value"))
+                    if r is None or c is None:
+                        continue
+                    try:
+                        tab = int(row.get("Tab", "0"))
+                    except (TypeError, ValueError):
+                        continue
+
+                    key = (tab, r, c)
+                    if key in self.buttons:
+                        note = (row.get("Note") or "").strip()
+                        self._set_note(key, note)
+                        display_text = (note[:display_len] + "...") if len(note) > display_len else note
+                        self._style_cell(key, color_note, bold=True, text=display_text)
+                        loaded += 1
 
             messagebox.showinfo("Load Complete", f"Loaded {loaded} notes\nMetadata restored.")
 
@@ -365,10 +432,13 @@ class LaserGridApp(tk.Tk):
     def clear_all(self, silent=False):
         if not silent and not messagebox.askyesno("Clear", "Remove all notes?"):
             return
-        for key in list(self.notes):
-            if key in self.buttons:
-                self.buttons[key].config(text=" ", bg=CONFIG["COLOR_BG_EMPTY"])
-        self.notes.clear()
+        for tab, r, c, _ in list(self._iter_notes()):
+            canvas, rect_id, text_id = self.buttons[(tab, r, c)]
+            canvas.itemconfig(rect_id, fill=CONFIG["COLOR_BG_EMPTY"])
+            canvas.itemconfig(text_id, text="")
+        for arr in self.note_arr.values():
+            for row in arr:
+                row[:] = [None] * len(row)
 
     # ── UI Creation ───────────────────────────────────────────────
 
@@ -484,8 +554,8 @@ class LaserGridApp(tk.Tk):
             return
 
         try:
-            x_param = self.x_axis_var.get()
-            y_param = self.y_axis_var.get()
+            x_param = sys.intern(self.x_axis_var.get())
+            y_param = sys.intern(self.y_axis_var.get())
 
             if x_param == y_param:
                 raise ValueError("X and Y axes cannot be the same parameter!")
@@ -501,17 +571,30 @@ class LaserGridApp(tk.Tk):
             self.x_count_label.config(text=f"{len(self.current_values_x)} values")
             self.y_count_label.config(text=f"{len(self.current_values_y)} values")
 
-            for tab in self.notebook.tabs():
-                self.notebook.forget(tab)
-            self.tab_frames.clear()
-
-            if self.qpulse_mode.get() == "Split":
-                self._create_split_grids()
+            self._hide_tooltip()
+            shape = (x_param, y_param, x_counts, y_counts, self.qpulse_mode.get())
+            if shape == self._last_shape:
+                # Same layout, new values: relabel the headers and keep every canvas item
+                self._relabel_headers()
             else:
-                self._create_single_grid()
+                for tab in self.notebook.tabs():
+                    self.notebook.forget(tab)
+                    self.nametowidget(tab).destroy()
+                self.tab_frames.clear()
+                self.buttons.clear()
+                self.note_arr.clear()
+                self._canvas_tabs.clear()
+                self._header_items.clear()
+                self._last_shape = None
+
+                if self.qpulse_mode.get() == "Split":
+                    self._create_split_grids()
+                else:
+                    self._create_single_grid()
+                self._last_shape = shape
 
             self.clear_all(silent=True)
-            self._update_global_field_states()
+            self._do_refresh_global_states()
 
         except ValueError as e:
             messagebox.showerror("Input Error", str(e))
@@ -530,19 +613,14 @@ class LaserGridApp(tk.Tk):
                 return [f"{start:.1f}"] * counts
             return [str(start)] * counts
 
+        # Format while generating: no intermediate list of floats
         step = (end - start) / (counts - 1)
-        values = [start + i * step for i in range(counts)]
-
-        if param in ["Speed", "Power", "Passes", "Q-Pulse"]:
-            formatted = [f"{int(round(v))}" for v in values]
-        elif param == "Line Interval":
-            formatted = [f"{v:.4f}" for v in values]
-        elif param == "Frequency":
-            formatted = [f"{v:.1f}" for v in values]
-        else:
-            formatted = [f"{v:.2f}" for v in values]
+        values = (start + i * step for i in range(counts))
 
-        return formatted
+        fmt_spec = VALUE_FORMATS.get(param, "%d" if param in INT_PARAMS else "%.2f")
+        if fmt_spec == "%d":
+            return [fmt_spec % round(v) for v in values]
+        return [fmt_spec % v for v in values]
 
     def _create_single_grid(self):
         frame = ttk.Frame(self.notebook)
@@ -571,45 +649,130 @@ class LaserGridApp(tk.Tk):
         self._build_grid(f2, 2, self.current_values_y, grid2_x)
 
     def _build_grid(self, parent, tab_id, y_values, x_values):
-        frame = tk.Frame(parent, padx=10, pady=10)
-        frame.pack(expand=True, fill='both')
-
-        tk.Label(frame, text=f"{self.current_y_param} ↓",
-                 font=(CONFIG["FONT_FAMILY"], CONFIG["FONT_SIZE_LABEL"], "bold")) \
-          .grid(row=0, column=0, padx=8, pady=8, sticky='nsew')
-
-        for col, val in enumerate(x_values, 1):
-            tk.Label(frame, text=val, width=10, relief="ridge", bg=CONFIG["COLOR_HEADER_X"],
-                     font=(CONFIG["FONT_FAMILY"], CONFIG["FONT_SIZE_LABEL"])) \
-              .grid(row=0, column=col, sticky='nsew')
-
-        for row, yval in enumerate(y_values, 1):
-            tk.Label(frame, text=yval, width=12, relief="ridge", bg=CONFIG["COLOR_HEADER_Y"],
-                     anchor="e", font=(CONFIG["FONT_FAMILY"], CONFIG["FONT_SIZE_LABEL"])) \
-              .grid(row=row, column=0, sticky='nsew')
-
-            for col, xval in enumerate(x_values, 1):
-                key = (tab_id, row-1, col-1)
-                btn = tk.Button(frame, text=" ", width=10, height=1, bg=CONFIG["COLOR_BG_EMPTY"],
-                               relief="groove", command=lambda k=key: self.edit_note(k))
-                btn.grid(row=row, column=col, padx=1, pady=1, sticky='nsew')
-                self.buttons[key] = btn
-
-        for i in range(len(x_values)+1):
-            frame.columnconfigure(i, weight=1)
-        for i in range(len(y_values)+1):
-            frame.rowconfigure(i, weight=1)
+        cell_w, cell_h = CONFIG["CELL_WIDTH"], CONFIG["CELL_HEIGHT"]
+        head_w, head_h = CONFIG["HEADER_WIDTH"], CONFIG["HEADER_HEIGHT"]
+
+        canvas = tk.Canvas(parent, width=head_w + len(x_values) * cell_w + 1,
+                           height=head_h + len(y_values) * cell_h + 1, highlightthickness=0)
+        canvas.pack(expand=True, padx=10, pady=10)
+
+        font_label = (CONFIG["FONT_FAMILY"], CONFIG["FONT_SIZE_LABEL"])
+        font_cell = self._cell_font
+        color_empty, color_fg = CONFIG["COLOR_BG_EMPTY"], CONFIG["COLOR_FG_TEXT"]
+        color_hx, color_hy = CONFIG["COLOR_HEADER_X"], CONFIG["COLOR_HEADER_Y"]
+        color_line = CONFIG["COLOR_GRID_LINE"]
+
+        canvas.create_text(head_w / 2, head_h / 2, text=f"{self.current_y_param} ↓",
+                           font=font_label + ("bold",))
+
+        x_ids, y_ids = [], []
+        for col, val in enumerate(x_values):
+            x = head_w + col * cell_w
+            canvas.create_rectangle(x, 0, x + cell_w, head_h, fill=color_hx, outline=color_line)
+            x_ids.append(canvas.create_text(x + cell_w / 2, head_h / 2, text=val, font=font_label))
+
+        for row, yval in enumerate(y_values):
+            y = head_h + row * cell_h
+            canvas.create_rectangle(0, y, head_w, y + cell_h, fill=color_hy, outline=color_line)
+            y_ids.append(canvas.create_text(head_w - 6, y + cell_h / 2, text=yval, anchor="e", font=font_label))
+
+            for col in range(len(x_values)):
+                x = head_w + col * cell_w
+                key = (tab_id, row, col)
+                rect_id = canvas.create_rectangle(x, y, x + cell_w, y + cell_h, fill=color_empty,
+                                                  outline=color_line, tags="cell")
+                text_id = canvas.create_text(x + cell_w / 2, y + cell_h / 2, text="", fill=color_fg,
+                                             font=font_cell, tags="cell")
+                self.buttons[key] = (canvas, rect_id, text_id)
+
+        self._canvas_tabs[canvas] = tab_id
+        self._header_items[tab_id] = (canvas, x_ids, y_ids)
+        canvas.bind("<Button-1>", self._on_canvas_click)
+        # One binding per grid; the tip text is looked up when the pointer arrives
+        canvas.tag_bind("cell", "<Enter>", self._maybe_show_tooltip)
+        canvas.tag_bind("cell", "<Leave>", self._hide_tooltip)
+        self.note_arr[tab_id] = [[None] * len(x_values) for _ in y_values]
+
+    def _relabel_headers(self):
+        # Split grids take consecutive slices of the X values, in tab order
+        offset = 0
+        for tab_id in sorted(self._header_items):
+            canvas, x_ids, y_ids = self._header_items[tab_id]
+            for item, val in zip(x_ids, self.current_values_x[offset:]):
+                canvas.itemconfig(item, text=val)
+            offset += len(x_ids)
+            for item, val in zip(y_ids, self.current_values_y):
+                canvas.itemconfig(item, text=val)
+
+    def _get_note(self, key):
+        tab, r, c = key
+        return self.note_arr[tab][r][c]
+
+    def _set_note(self, key, text):
+        tab, r, c = key
+        self.note_arr[tab][r][c] = text or None
+
+    def _iter_notes(self):
+        # (tab, row, col, text) per filled cell, tab by tab in row-major order
+        for tab, arr in self.note_arr.items():
+            for r, row in enumerate(arr):
+                for c, text in enumerate(row):
+                    if text is not None:
+                        yield tab, r, c, text
+
+    def _hit_test(self, event):
+        canvas = event.widget
+        tab_id = self._canvas_tabs.get(canvas)
+        if tab_id is None:
+            return None
+        col = int((canvas.canvasx(event.x) - CONFIG["HEADER_WIDTH"]) // CONFIG["CELL_WIDTH"])
+        row = int((canvas.canvasy(event.y) - CONFIG["HEADER_HEIGHT"]) // CONFIG["CELL_HEIGHT"])
+        if row < 0 or col < 0:
+            return None
+        return (tab_id, row, col)
+
+    def _on_canvas_click(self, event):
+        self.edit_note(self._hit_test(event))
+
+    def _maybe_show_tooltip(self, event):
+        key = self._hit_test(event)
+        if key not in self.buttons:
+            return
+        note = self._get_note(key)
+        if note is None or len(note) <= CONFIG["DISPLAY_NOTE_LENGTH"]:
+            return
+        if self._tooltip is None:
+            self._tooltip = ToolTip(event.widget, note, bind=False)
+        tip = self._tooltip
+        tip.hide_tip()
+        tip.widget = event.widget
+        tip.text = note
+        _, r, c = key
+        tip.offset = (CONFIG["HEADER_WIDTH"] + c * CONFIG["CELL_WIDTH"],
+                      CONFIG["HEADER_HEIGHT"] + r * CONFIG["CELL_HEIGHT"])
+        tip.show_tip(event)
+
+    def _hide_tooltip(self, event=None):
+        if self._tooltip is not None:
+            self._tooltip.hide_tip()
+
+    def _style_cell(self, key, bg, bold=False, text=None):
+        canvas, rect_id, text_id = self.buttons[key]
+        canvas.itemconfig(rect_id, fill=bg)
+        font = self._cell_font_bold if bold else self._cell_font
+        if text is None:
+            canvas.itemconfig(text_id, fill=CONFIG["COLOR_FG_TEXT"], font=font)
+        else:
+            canvas.itemconfig(text_id, text=text, fill=CONFIG["COLOR_FG_TEXT"], font=font)
 
     def edit_note(self, key):
-        btn = self.buttons.get(key)
-        if not btn:
+        if key not in self.buttons:
             return
 
-        current = self.notes.get(key, "")
+        current = self._get_note(key) or ""
 
         # Highlight while editing
-        btn.config(bg=CONFIG["COLOR_BG_EDITING"], fg=CONFIG["COLOR_FG_TEXT"],
-                   font=(CONFIG["FONT_FAMILY"], CONFIG["FONT_SIZE_BUTTON"], "bold"))
+        self._style_cell(key, CONFIG["COLOR_BG_EDITING"], bold=True)
 
         new_text = simpledialog.askstring("Note", "Enter note/rating:",
                                          initialvalue=current, parent=self)
@@ -617,29 +780,22 @@ class LaserGridApp(tk.Tk):
         if new_text is None:
             # Cancelled
             if current:
-                btn.config(bg=CONFIG["COLOR_BG_NOTE"], fg=CONFIG["COLOR_FG_TEXT"],
-                           font=(CONFIG["FONT_FAMILY"], CONFIG["FONT_SIZE_BUTTON"], "bold"))
+                self._style_cell(key, CONFIG["COLOR_BG_NOTE"], bold=True)
             else:
-                btn.config(bg=CONFIG["COLOR_BG_EMPTY"], fg=CONFIG["COLOR_FG_TEXT"],
-                           font=(CONFIG["FONT_FAMILY"], CONFIG["FONT_SIZE_BUTTON"]))
+                self._style_cell(key, CONFIG["COLOR_BG_EMPTY"])
             return
 
         new_text = new_text.strip()
         if len(new_text) > CONFIG["MAX_NOTE_LENGTH"]:
             new_text = new_text[:CONFIG["MAX_NOTE_LENGTH"]]
 
+        self._set_note(key, new_text)
         if new_text:
-            self.notes[key] = new_text
-            display_text = (new_text[:CONFIG["DISPLAY_NOTE_LENGTH"]] + "...") \
-                if len(new_text) > CONFIG["DISPLAY_NOTE_LENGTH"] else new_text
-            btn.config(text=display_text, bg=CONFIG["COLOR_BG_NOTE"], fg=CONFIG["COLOR_FG_TEXT"],
-                       font=(CONFIG["FONT_FAMILY"], CONFIG["FONT_SIZE_BUTTON"], "bold"))
-            if len(new_text) > CONFIG["DISPLAY_NOTE_LENGTH"]:
-                ToolTip(btn, new_text)
+            display_len = CONFIG["DISPLAY_NOTE_LENGTH"]
+            display_text = (new_text[:display_len] + "...") if len(new_text) > display_len else new_text
+            self._style_cell(key, CONFIG["COLOR_BG_NOTE"], bold=True, text=display_text)
         else:
-            self.notes.pop(key, None)
-            btn.config(text=" ", bg=CONFIG["COLOR_BG_EMPTY"], fg=CONFIG["COLOR_FG_TEXT"],
-                       font=(CONFIG["FONT_FAMILY"], CONFIG["FONT_SIZE_BUTTON"]))
+            self._style_cell(key, CONFIG["COLOR_BG_EMPTY"], text="")
 
 if __name__ == "__main__":
     app = LaserGridApp()